@@ -27,9 +27,22 @@ import subprocess
 import platform
 import getpass
 import socket
+import sqlite3
+import threading
+import time
+import functools
+import logging
+import queue
+import random
+import re
+import atexit
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Set, Tuple, Optional
+from typing import List, Dict, Set, Tuple, Optional, Iterator
 from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 # Azure SDK imports
@@ -38,12 +51,29 @@ try:
     from azure.mgmt.containerregistry import ContainerRegistryManagementClient
     from azure.mgmt.web import WebSiteManagementClient
     from azure.core.exceptions import AzureError
+    import requests
+    from requests.adapters import HTTPAdapter
 except ImportError:
     print("ERROR: Required Azure packages not found.")
     print("Please install them using:")
-    print("  pip install azure-identity azure-mgmt-containerregistry azure-mgmt-web")
+    print("  pip install azure-identity azure-mgmt-containerregistry azure-mgmt-web requests")
     sys.exit(1)
 
+# Optional fast timestamp parser (C extension); falls back to the standard library
+try:
+    from ciso8601 import parse_rfc3339
+except ImportError:
+    parse_rfc3339 = None
+
+# Optional fast JSON parser and serializer; falls back to the standard library.
+# Both parsers accept the raw response bytes, avoiding an intermediate str decode.
+try:
+    from orjson import loads as json_loads, dumps as orjson_dumps, OPT_INDENT_2
+except ImportError:
+    json_loads = json.loads
+    orjson_dumps = None
+
+
 
 # ============================================================================
 # CONFIGURATION SECTION
@@ -66,15 +96,125 @@ SUBSCRIPTION_ID = os.getenv('AZURE_SUBSCRIPTION_ID', '')
 ACR_NAME = os.getenv('AZURE_ACR_NAME', '')  # Your Azure Container Registry name
 ACR_RESOURCE_GROUP = os.getenv('AZURE_ACR_RESOURCE_GROUP', '')  # Resource group containing the ACR
 
+# Optional comma-separated list of repositories to clean. When set, only these
+# repositories are scanned and the (potentially slow) registry catalog listing
+# is skipped entirely - equivalent to ACR purge's --filter '<repo>:.*'.
+ACR_REPOSITORIES = [repo.strip() for repo in os.getenv('AZURE_ACR_REPOSITORIES', '').split(',') if repo.strip()]
+
 # Age threshold for image deletion (in days)
 IMAGE_AGE_THRESHOLD_DAYS = 30
 
+# Maximum number of concurrent ACR queries (kept low to avoid registry throttling)
+MAX_ACR_WORKERS = 16
+
+# Maximum number of concurrent App Service and deployment slot reads
+MAX_APP_SERVICE_WORKERS = 16
+
+# Maximum number of concurrent manifest deletions in hard delete mode
+MAX_DELETE_WORKERS = 20
+
+# Hard delete progress is written to the console once per this many completed deletions
+DELETE_PROGRESS_BATCH_SIZE = 20
+
+# ACR REST API connection pool size and per-request timeout (in seconds)
+ACR_HTTP_POOL_SIZE = 32
+ACR_HTTP_TIMEOUT = 30
+
+# Page sizes used when listing repositories and manifests
+ACR_CATALOG_PAGE_SIZE = 1000
+ACR_MANIFEST_PAGE_SIZE = 500
+
+# Retries for throttled ACR requests (HTTP 429/503), with exponential backoff (in seconds).
+# A Retry-After header from the registry takes precedence over the computed delay.
+ACR_MAX_RETRIES = 5
+ACR_RETRY_BASE_DELAY = 1
+ACR_RETRY_MAX_DELAY = 30
+
+# Aggregate rate limit for all ACR requests across worker threads, so concurrency
+# stays below the registry's throttling limit (lower this for Basic-tier registries)
+ACR_REQUESTS_PER_SECOND = 50
+
+# On-disk cache of ACR responses, revalidated with ETag/Last-Modified on every run
+# so unchanged listings and tags cost a bodyless 304 instead of a full response.
+# Set AZURE_ACR_CACHE_FILE to an empty string to disable caching.
+HTTP_CACHE_FILE = os.getenv('AZURE_ACR_CACHE_FILE', str(Path.home() / '.cache' / 'acr-purge' / 'http_cache.sqlite'))
+HTTP_CACHE_MAX_AGE_DAYS = 30  # Entries not seen for this long are pruned
+
+# Container image reference as found in App Service settings, e.g.
+# 'DOCKER|myacr.azurecr.io/team/app:1.2' or 'myacr.azurecr.io/team/app@sha256:<hex>'
+IMAGE_REF_RE = re.compile(
+    r'^(?:DOCKER\|)?(?P<host>[^/|]+)/(?P<repository>[^:@]+)'
+    r'(?::(?P<tag>[^@]+))?(?:@(?P<digest>sha256:[0-9a-f]{64}))?$',
+    re.IGNORECASE
+)
+
+# Resource group segment of an ARM resource ID
+RESOURCE_GROUP_RE = re.compile(r'/resourceGroups/([^/]+)/', re.IGNORECASE)
+
+# Manifest media types accepted when resolving tags, so the registry reports
+# the digest of the stored manifest (including multi-arch indexes) unchanged
+MANIFEST_ACCEPT_TYPES = ', '.join([
+    'application/vnd.docker.distribution.manifest.v2+json',
+    'application/vnd.docker.distribution.manifest.list.v2+json',
+    'application/vnd.oci.image.manifest.v1+json',
+    'application/vnd.oci.image.index.v1+json',
+])
+
+# Byte size unit conversion factors (exact, as the divisors are powers of two)
+_BYTES_TO_MB = 1.0 / (1024 * 1024)
+_BYTES_TO_GB = 1.0 / (1024 * 1024 * 1024)
+
+# Console report rules and title box borders
+_HR = "=" * 80
+_HR_LIGHT = "-" * 80
+_BOX_TOP = "╔" + "=" * 78 + "╗"
+_BOX_BOT = "╚" + "=" * 78 + "╝"
+
 # Script version for audit trail
 SCRIPT_VERSION = "1.0.0"
 
 # Audit directory
 AUDIT_DIR = Path("audits")
 
+# Audit files are written as compact JSON; set AZURE_ACR_AUDIT_PRETTY=1 to indent them for reading
+AUDIT_PRETTY = os.getenv('AZURE_ACR_AUDIT_PRETTY', '').lower() in ('1', 'true', 'yes')
+
+# Log level for scan progress output (set to DEBUG to show App Service configuration details)
+LOG_LEVEL = os.getenv('AZURE_ACR_PURGE_LOG_LEVEL', 'INFO').upper()
+
+# Scan progress is logged through a queue and written by a single background
+# thread, so worker threads never block on console output
+logger = logging.getLogger('acr_image_cleanup')
+_log_queue = queue.Queue()
+
+# ============================================================================
+# LOGGING
+# ============================================================================
+
+def configure_logging():
+    """
+    Routes log records through a queue to a background thread that writes them to stdout.
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+
+    listener = QueueListener(_log_queue, handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger.addHandler(QueueHandler(_log_queue))
+    logger.setLevel(LOG_LEVEL)
+    logger.propagate = False
+
+
+def flush_logs():
+    """
+    Blocks until all queued log records have been written.
+    Call before printing directly so output stays in order.
+    """
+    _log_queue.join()
+
+
 # ============================================================================
 # AUTHENTICATION
 # ============================================================================
@@ -87,9 +227,9 @@ def validate_configuration():
     Returns:
         Tuple of (subscription_id, acr_name, acr_resource_group)
     """
-    print("=" * 80)
+    print(_HR)
     print("VALIDATING CONFIGURATION")
-    print("=" * 80)
+    print(_HR)
     print()
 
     # Use global variables but allow runtime override
@@ -125,6 +265,7 @@ def validate_configuration():
     print(f"✓ Subscription ID: {subscription_id[:8]}...")
     print(f"✓ ACR Name: {acr_name}")
     print(f"✓ ACR Resource Group: {acr_resource_group}")
+    print(f"✓ Repositories: {', '.join(ACR_REPOSITORIES) if ACR_REPOSITORIES else 'all'}")
     print(f"✓ Image Age Threshold: {IMAGE_AGE_THRESHOLD_DAYS} days")
     print(f"✓ Authentication: Azure CLI")
     print()
@@ -143,9 +284,9 @@ def authenticate_azure(subscription_id: str) -> Tuple[AzureCliCredential, Contai
     Returns:
         Tuple containing credential object, ACR client, and Web client
     """
-    print("=" * 80)
+    print(_HR)
     print("AUTHENTICATING WITH AZURE")
-    print("=" * 80)
+    print(_HR)
 
     try:
         # Create credential object using Azure CLI authentication
@@ -175,156 +316,737 @@ def authenticate_azure(subscription_id: str) -> Tuple[AzureCliCredential, Contai
         sys.exit(1)
 
 
+# ============================================================================
+# ACR REGISTRY ACCESS
+# ============================================================================
+
+class RateLimiter:
+    """
+    Token bucket limiting the aggregate request rate across threads.
+    Used as a context manager around each request; safe to share between worker threads.
+    """
+
+    def __init__(self, rate: float):
+        """
+        Args:
+            rate: Sustained requests per second (also the maximum burst size)
+        """
+        self._rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._rate, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return self
+
+                wait_seconds = (1 - self._tokens) / self._rate
+
+            time.sleep(wait_seconds)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+class HttpResponseCache:
+    """
+    SQLite-backed store of ACR responses keyed by request, holding the
+    ETag / Last-Modified validators used for conditional requests.
+    Safe to share between worker threads.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Location of the SQLite database file (created if missing)
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " headers TEXT NOT NULL,"
+            " body BLOB NOT NULL,"
+            " updated_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "DELETE FROM responses WHERE updated_at < ?",
+            (time.time() - HTTP_CACHE_MAX_AGE_DAYS * 86400,)
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Tuple[Dict[str, str], bytes]]:
+        """
+        Returns the cached (headers, body) for a request key, or None on a miss.
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT headers, body FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def put(self, key: str, headers: Dict[str, str], body: bytes):
+        """
+        Stores (or refreshes) the response for a request key.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, headers, body, updated_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(headers), body, time.time())
+            )
+            self._conn.commit()
+
+    def touch(self, key: str):
+        """
+        Marks the response for a request key as still current (after a 304), so
+        entries that keep validating are not pruned.
+        """
+        with self._lock:
+            self._conn.execute("UPDATE responses SET updated_at = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+
+
+class AcrRegistryClient:
+    """
+    Minimal client for the ACR data-plane REST API.
+
+    Exchanges the Azure CLI credential for ACR access tokens and sends every
+    request through a single pooled session, so TLS connections are reused
+    instead of paying Azure CLI startup and a new handshake per call.
+    Safe to share between worker threads.
+    """
+
+    def __init__(self, acr_name: str, credential: AzureCliCredential):
+        """
+        Args:
+            acr_name: Name of the Azure Container Registry
+            credential: Azure CLI credential used for the token exchange
+        """
+        self.acr_name = acr_name
+        self.login_server = f"{acr_name}.azurecr.io".lower()
+        self.base_url = f"https://{self.login_server}"
+        self._credential = credential
+
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=ACR_HTTP_POOL_SIZE, pool_maxsize=ACR_HTTP_POOL_SIZE)
+        self._session.mount('https://', adapter)
+        self._limiter = RateLimiter(ACR_REQUESTS_PER_SECOND)
+
+        # The refresh token is exchanged once under _token_lock; access tokens are
+        # fetched under a lock per scope, so different scopes are fetched concurrently
+        self._token_lock = threading.Lock()
+        self._refresh_token = None
+        self._access_tokens = {}  # Maps token scope to ACR access token
+        self._scope_locks_lock = threading.Lock()
+        self._scope_locks = {}
+
+        # Per-request locks so concurrent workers never stampede on the same cache miss
+        self._cache = None
+        self._key_locks_lock = threading.Lock()
+        self._key_locks = {}
+
+        if HTTP_CACHE_FILE:
+            try:
+                self._cache = HttpResponseCache(Path(HTTP_CACHE_FILE))
+            except (sqlite3.Error, OSError) as e:
+                print(f"Warning: ACR response cache disabled ({HTTP_CACHE_FILE}): {e}")
+
+        # Repeated lookups of the same repository:tag within a run are answered from memory
+        self.resolve_digest = functools.lru_cache(maxsize=4096)(self._resolve_digest)
+
+    def _get_access_token(self, scope: str, refresh: bool = False) -> str:
+        """
+        Returns an ACR access token for the given scope, exchanging the Azure CLI
+        token for an ACR refresh token on first use.
+
+        Args:
+            scope: ACR token scope (e.g., 'repository:myrepo:pull')
+            refresh: Discard any cached token for this scope first
+
+        Returns:
+            ACR access token
+        """
+        with self._scope_lock(scope):
+            if refresh:
+                self._access_tokens.pop(scope, None)
+
+            if scope in self._access_tokens:
+                return self._access_tokens[scope]
+
+            refresh_token = self._get_refresh_token()
+            with self._limiter:
+                response = self._session.post(
+                    f"{self.base_url}/oauth2/token",
+                    data={
+                        'grant_type': 'refresh_token',
+                        'service': self.login_server,
+                        'scope': scope,
+                        'refresh_token': refresh_token
+                    },
+                    timeout=ACR_HTTP_TIMEOUT
+                )
+            response.raise_for_status()
+            self._access_tokens[scope] = response.json()['access_token']
+
+            return self._access_tokens[scope]
+
+    def _get_refresh_token(self) -> str:
+        """
+        Returns the ACR refresh token, exchanging the Azure CLI token for it on first use.
+        """
+        with self._token_lock:
+            if self._refresh_token is None:
+                aad_token = self._credential.get_token('https://management.azure.com/.default').token
+                with self._limiter:
+                    response = self._session.post(
+                        f"{self.base_url}/oauth2/exchange",
+                        data={
+                            'grant_type': 'access_token',
+                            'service': self.login_server,
+                            'access_token': aad_token
+                        },
+                        timeout=ACR_HTTP_TIMEOUT
+                    )
+                response.raise_for_status()
+                self._refresh_token = response.json()['refresh_token']
+
+            return self._refresh_token
+
+    def _scope_lock(self, scope: str) -> threading.Lock:
+        """
+        Returns the lock serializing access token requests for a single scope.
+        """
+        with self._scope_locks_lock:
+            return self._scope_locks.setdefault(scope, threading.Lock())
+
+    def _send(self, method: str, path: str, scope: str, headers: Dict, **kwargs) -> requests.Response:
+        """
+        Sends a single request, retrying once with a fresh token if the cached one was rejected.
+        """
+        for attempt in range(2):
+            headers['Authorization'] = f"Bearer {self._get_access_token(scope, refresh=attempt > 0)}"
+            with self._limiter:
+                response = self._session.request(
+                    method, self.base_url + path,
+                    headers=headers,
+                    timeout=ACR_HTTP_TIMEOUT,
+                    **kwargs
+                )
+            if response.status_code != 401:
+                break
+
+        return response
+
+    def request(self, method: str, path: str, scope: str, **kwargs) -> requests.Response:
+        """
+        Sends an authenticated request to the registry.
+        Throttled requests (HTTP 429/503) are retried, honoring Retry-After when
+        present and otherwise backing off exponentially with jitter.
+
+        Args:
+            method: HTTP method
+            path: Request path relative to the registry (e.g., '/v2/_catalog')
+            scope: ACR token scope required by the request
+            **kwargs: Additional arguments passed to requests
+
+        Returns:
+            Response object
+
+        Raises:
+            requests.RequestException: If the request fails or returns an error status
+        """
+        headers = kwargs.pop('headers', {})
+
+        for attempt in range(ACR_MAX_RETRIES + 1):
+            response = self._send(method, path, scope, headers, **kwargs)
+            if response.status_code not in (429, 503) or attempt == ACR_MAX_RETRIES:
+                break
+
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                delay = min(ACR_RETRY_MAX_DELAY, int(retry_after))
+            else:
+                delay = min(ACR_RETRY_MAX_DELAY, ACR_RETRY_BASE_DELAY * 2 ** attempt)
+                delay = random.uniform(delay / 2, delay)
+
+            logger.warning(f"  Warning: ACR throttled {method} {path} (HTTP {response.status_code}), "
+                           f"retry {attempt + 1}/{ACR_MAX_RETRIES} in {delay:.1f}s")
+            time.sleep(delay)
+
+        response.raise_for_status()
+        return response
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        """
+        Returns the lock serializing requests for a single cache key.
+        """
+        with self._key_locks_lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def cached_request(self, method: str, path: str, scope: str, headers: Optional[Dict] = None) -> requests.Response:
+        """
+        Sends a GET or HEAD request through the on-disk response cache.
+
+        Cached responses are revalidated with If-None-Match / If-Modified-Since;
+        a 304 reply is answered from the cache. Concurrent requests for the same
+        key wait for the first one instead of all missing the cache together.
+
+        Args:
+            method: HTTP method ('GET' or 'HEAD')
+            path: Request path relative to the registry
+            scope: ACR token scope required by the request
+            headers: Additional request headers (optional)
+
+        Returns:
+            Response object (reconstructed from the cache on a 304)
+        """
+        headers = dict(headers or {})
+
+        if self._cache is None:
+            return self.request(method, path, scope, headers=headers)
+
+        # The Accept header changes what the registry returns, so it is part of the key
+        key = f"{method} {self.base_url}{path} {headers.get('Accept', '')}"
+
+        with self._key_lock(key):
+            entry = self._cache.get(key)
+
+            if entry:
+                cached_headers, cached_body = entry
+                if 'etag' in cached_headers:
+                    headers['If-None-Match'] = cached_headers['etag']
+                if 'last-modified' in cached_headers:
+                    headers['If-Modified-Since'] = cached_headers['last-modified']
+
+            response = self.request(method, path, scope, headers=headers)
+
+            if response.status_code == 304 and entry:
+                self._cache.touch(key)
+                cached = requests.Response()
+                cached.status_code = 200
+                cached.url = response.url
+                cached.headers = requests.structures.CaseInsensitiveDict(cached_headers)
+                cached._content = cached_body
+                return cached
+
+            if 'ETag' in response.headers or 'Last-Modified' in response.headers:
+                self._cache.put(
+                    key,
+                    {name.lower(): value for name, value in response.headers.items()},
+                    response.content
+                )
+
+            return response
+
+    def _next_page_path(self, response: requests.Response) -> str:
+        """
+        Extracts the path of the next page from the Link response header.
+
+        Returns:
+            Path relative to the registry, or empty string on the last page
+        """
+        # Continuation links are usually relative to the registry
+        next_url = response.links.get('next', {}).get('url', '')
+        if next_url.startswith(self.base_url):
+            next_url = next_url[len(self.base_url):]
+        return next_url
+
+    def _get_paged(self, path: str, scope: str, key: str):
+        """
+        Yields items from a paginated registry listing, following the
+        continuation links returned in the Link response header.
+
+        Continuation markers ('last=') are strictly sequential, so pages cannot
+        be fetched out of order. Instead the next page is requested in the
+        background while the current one is being parsed.
+
+        Args:
+            path: Path of the first page, including query parameters
+            scope: ACR token scope required by the listing
+            key: JSON key holding the items in each page
+
+        Yields:
+            Items from each page in order
+
+        Raises:
+            ValueError: If the registry repeats a continuation link, which would
+                otherwise silently truncate or loop over the listing
+        """
+        seen_paths = {path}
+
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            pending = prefetcher.submit(self.cached_request, 'GET', path, scope)
+
+            while pending is not None:
+                response = pending.result()
+                next_path = self._next_page_path(response)
+
+                if next_path in seen_paths:
+                    raise ValueError(f"Registry repeated continuation link '{next_path}'")
+
+                if next_path:
+                    seen_paths.add(next_path)
+                    pending = prefetcher.submit(self.cached_request, 'GET', next_path, scope)
+                else:
+                    pending = None
+
+                yield from json_loads(response.content).get(key) or []
+
+    def list_repositories(self) -> List[str]:
+        """
+        Lists all repository names in the registry.
+
+        Returns:
+            List of repository names
+        """
+        return list(self._get_paged(
+            f"/v2/_catalog?n={ACR_CATALOG_PAGE_SIZE}",
+            scope='registry:catalog:*',
+            key='repositories'
+        ))
+
+    def list_manifests(self, repository: str) -> Iterator[Dict]:
+        """
+        Streams all manifests in a repository with their metadata
+        (digest, tags, createdTime, imageSize), one page at a time.
+
+        Args:
+            repository: Repository name
+
+        Yields:
+            Raw manifest attribute dictionaries
+        """
+        return self._get_paged(
+            f"/acr/v1/{repository}/_manifests?n={ACR_MANIFEST_PAGE_SIZE}",
+            scope=f"repository:{repository}:metadata_read",
+            key='manifests'
+        )
+
+    def _resolve_digest(self, repository: str, tag: str) -> str:
+        """
+        Resolves a tag to its manifest digest with a HEAD request, reading the
+        Docker-Content-Digest response header. Memoized per client as resolve_digest.
+
+        Args:
+            repository: Repository name
+            tag: Tag name
+
+        Returns:
+            Lowercase manifest digest, or empty string if the registry did not report one
+        """
+        response = self.cached_request(
+            'HEAD', f"/v2/{repository}/manifests/{tag}",
+            scope=f"repository:{repository}:pull",
+            headers={'Accept': MANIFEST_ACCEPT_TYPES}
+        )
+        return response.headers.get('Docker-Content-Digest', '').lower()
+
+    def delete_manifest(self, repository: str, digest: str) -> None:
+        """
+        Deletes a manifest, along with all tags referencing it, from the registry.
+
+        Args:
+            repository: Repository name
+            digest: Manifest digest
+
+        Raises:
+            requests.RequestException: If the deletion fails
+        """
+        self.request('DELETE', f"/v2/{repository}/manifests/{digest}",
+                     scope=f"repository:{repository}:delete")
+
+
 # ============================================================================
 # ACR IMAGE DISCOVERY
 # ============================================================================
 
-def get_all_acr_manifests(acr_name: str, resource_group: str) -> Dict[str, List[Dict]]:
+def _cancel_pending(futures) -> None:
+    """
+    Cancels futures that have not started yet, so leaving their executor only waits
+    for work already in progress. Used when Ctrl+C or an error stops a parallel step.
+    (ThreadPoolExecutor.shutdown(cancel_futures=True) requires Python 3.9.)
+
+    Args:
+        futures: Futures submitted to an executor
+    """
+    for future in futures:
+        future.cancel()
+
+
+def _parse_timestamp(value: str) -> datetime:
     """
-    Retrieves all repositories and their manifests from the specified ACR.
-    Uses Azure CLI for detailed manifest information as the SDK has limitations.
+    Parses an ISO 8601 timestamp as returned by ACR (e.g., '2024-01-15T10:30:00.1234567Z').
+    Uses ciso8601 when installed, otherwise the standard library.
 
     Args:
-        acr_name: Name of the Azure Container Registry
-        resource_group: Resource group containing the ACR
+        value: Timestamp string
 
     Returns:
-        Dictionary mapping repository names to lists of manifest information
+        Timezone-aware datetime
+
+    Raises:
+        ValueError: If the timestamp cannot be parsed
     """
-    print("=" * 80)
-    print("DISCOVERING ACR REPOSITORIES AND MANIFESTS")
-    print("=" * 80)
+    if parse_rfc3339 is not None:
+        return parse_rfc3339(value)
 
-    repositories = {}
+    # datetime.fromisoformat only accepts the 'Z' suffix from Python 3.11
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
 
-    try:
-        # Get list of repositories using Azure CLI
-        print(f"Fetching repositories from ACR '{acr_name}'...")
-        result = subprocess.run(
-            ['az.cmd', 'acr', 'repository', 'list', '--name', acr_name],
-            capture_output=True,
-            text=True,
-            check=True
-        )
 
-        repo_list = json.loads(result.stdout)
-        print(f"✓ Found {len(repo_list)} repositories")
-        print()
+def _fetch_manifests(registry: AcrRegistryClient,
+                     repo: str,
+                     cutoff_date: datetime) -> Tuple[str, List[Dict], int, int, List[str]]:
+    """
+    Retrieves all manifests for a single repository and keeps those older than the cutoff date.
+    Runs inside a worker thread, so output is buffered and returned to the caller.
 
-        # For each repository, get all manifests
-        for repo in repo_list:
-            print(f"Processing repository: {repo}")
-
-            # Get all manifests for this repository
-            manifest_result = subprocess.run(
-                ['az.cmd', 'acr', 'repository', 'show-manifests',
-                 '--name', acr_name,
-                 '--repository', repo,
-                 '--detail'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
+    Args:
+        registry: ACR registry client
+        repo: Repository name
+        cutoff_date: Manifests created on or after this date are skipped
 
-            manifests = json.loads(manifest_result.stdout)
-
-            # Process each manifest
-            manifest_list = []
-            for manifest in manifests:
-                # Extract relevant information
-                digest = manifest.get('digest', '').lower()  # Normalize to lowercase
-                tags = manifest.get('tags', [])
-                created_time_str = manifest.get('createdTime', '')
-                size_bytes = manifest.get('imageSize', 0)
-
-                # Parse creation time
-                created_time = None
-                if created_time_str:
-                    try:
-                        # Azure returns time in ISO 8601 format
-                        created_time = datetime.fromisoformat(created_time_str.replace('Z', '+00:00'))
-                    except ValueError:
-                        print(f"  Warning: Could not parse time for manifest {digest[:12]}")
-
-                manifest_info = {
-                    'digest': digest,
-                    'tags': tags if tags else ['<untagged>'],
-                    'created_time': created_time,
-                    'size_bytes': size_bytes,
-                    'repository': repo
-                }
+    Returns:
+        Tuple of (repository name, list of old manifest information,
+        number of manifests scanned, number of tags scanned, list of output lines)
+    """
+    output = []
+
+    # Repository names and tags repeat across many manifest records; interning
+    # keeps a single shared string object for each distinct value
+    repo = sys.intern(repo)
+
+    # Process each manifest as its page arrives and only build records for manifests
+    # older than the cutoff, so young manifests never allocate anything
+    manifest_list = []
+    manifests_scanned = 0
+    tags_scanned = 0
+    for manifest in registry.list_manifests(repo):
+        manifests_scanned += 1
+        tags = manifest.get('tags', [])
+        tags_scanned += len(tags) if tags else 1
+        created_time_str = manifest.get('createdTime', '')
+
+        # Parse creation time
+        if not created_time_str:
+            output.append(f"  Warning: Manifest {manifest.get('digest', '')[:12]} has no creation time, skipping")
+            continue
+        try:
+            # Azure returns time in ISO 8601 format
+            created_time = _parse_timestamp(created_time_str)
+        except ValueError:
+            output.append(f"  Warning: Could not parse time for manifest {manifest.get('digest', '')[:12]}, skipping")
+            continue
+
+        if created_time >= cutoff_date:
+            continue
 
-                manifest_list.append(manifest_info)
+        tags = [sys.intern(tag) for tag in tags] if tags else ['<untagged>']
+        manifest_info = {
+            'digest': manifest.get('digest', '').lower(),  # Normalize to lowercase
+            'tags': tags,
+            'tags_str': ', '.join(tags),  # Display form, shared by all reports
+            'created_time': created_time,
+            'size_bytes': manifest.get('imageSize', 0),
+            'repository': repo
+        }
 
-            repositories[repo] = manifest_list
-            print(f"  ✓ Found {len(manifest_list)} manifests with {sum(len(m['tags']) for m in manifest_list)} total tags")
+        manifest_list.append(manifest_info)
 
-        print()
-        total_manifests = sum(len(manifests) for manifests in repositories.values())
-        print(f"✓ Total manifests discovered: {total_manifests}")
-        print()
+    return repo, manifest_list, manifests_scanned, tags_scanned, output
+
+
+def get_all_acr_manifests(registry: AcrRegistryClient,
+                          threshold_days: int,
+                          repositories: Optional[List[str]] = None) -> Tuple[Dict[str, List[Dict]], int]:
+    """
+    Retrieves all repositories from the specified ACR and collects their manifests
+    older than the specified threshold.
+    Uses the ACR REST API for detailed manifest information as the management SDK has limitations.
+    Repositories are queried concurrently (bounded by MAX_ACR_WORKERS).
+
+    Args:
+        registry: ACR registry client
+        threshold_days: Age threshold in days
+        repositories: Explicit list of repositories to scan (optional). When provided,
+            the registry catalog is not listed.
+
+    Returns:
+        Tuple of (dictionary mapping repository names to lists of old manifest
+        information, total number of manifests scanned)
+    """
+    logger.info(_HR)
+    logger.info("DISCOVERING ACR REPOSITORIES AND MANIFESTS")
+    logger.info(_HR)
+
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=threshold_days)
+    logger.info(f"Cutoff date: {cutoff_date.strftime('%Y-%m-%d %H:%M:%S UTC')}")
 
-        return repositories
+    old_repositories = {}
+    total_manifests = 0
 
-    except subprocess.CalledProcessError as e:
-        print(f"\nERROR: Failed to query ACR: {e}")
-        print(f"STDERR: {e.stderr}")
+    try:
+        if repositories:
+            # Targeted cleanup - skip the registry catalog listing
+            repo_list = list(dict.fromkeys(repositories))
+            logger.info(f"Using {len(repo_list)} configured repositories from ACR '{registry.acr_name}'")
+        else:
+            # Get list of repositories from the registry catalog
+            logger.info(f"Fetching repositories from ACR '{registry.acr_name}'...")
+            repo_list = registry.list_repositories()
+            logger.info(f"✓ Found {len(repo_list)} repositories")
+        logger.info('')
+
+        # Fetch manifests for all repositories concurrently; output is printed
+        # from this thread as each repository completes so lines never interleave
+        if repo_list:
+            with ThreadPoolExecutor(max_workers=min(MAX_ACR_WORKERS, len(repo_list))) as executor:
+                futures = [executor.submit(_fetch_manifests, registry, repo, cutoff_date) for repo in repo_list]
+
+                try:
+                    for future in as_completed(futures):
+                        repo, manifest_list, manifests_scanned, tags_scanned, output = future.result()
+                        total_manifests += manifests_scanned
+                        if manifest_list:
+                            old_repositories[repo] = manifest_list
+
+                        # One log record per repository keeps its lines together
+                        logger.info('\n'.join([
+                            f"Processing repository: {repo}",
+                            *output,
+                            f"  ✓ Found {manifests_scanned} manifests with {tags_scanned} total tags, "
+                            f"{len(manifest_list)} older than {threshold_days} days"
+                        ]))
+                except (KeyboardInterrupt, Exception):
+                    # Ctrl+C or a failed repository stops the scan without waiting for queued repositories
+                    _cancel_pending(futures)
+                    raise
+
+        total_old_manifests = sum(len(manifests) for manifests in old_repositories.values())
+        logger.info('')
+        logger.info(f"✓ Total manifests discovered: {total_manifests}")
+        logger.info(f"✓ Found {total_old_manifests} manifests older than {threshold_days} days")
+        logger.info('')
+
+        return old_repositories, total_manifests
+
+    except ValueError as e:
+        logger.error(f"\nERROR: Failed to parse ACR response: {e}")
         sys.exit(1)
-    except json.JSONDecodeError as e:
-        print(f"\nERROR: Failed to parse ACR response: {e}")
+    except requests.RequestException as e:
+        logger.error(f"\nERROR: Failed to query ACR: {e}")
         sys.exit(1)
 
 
-def filter_manifests_by_age(repositories: Dict[str, List[Dict]], threshold_days: int) -> Dict[str, List[Dict]]:
+# ============================================================================
+# APP SERVICE IMAGE DETECTION
+# ============================================================================
+
+def _inspect_slot(web_client: WebSiteManagementClient,
+                  resource_group: str,
+                  app_name: str,
+                  slot_name: str,
+                  acr_login_server: str) -> Tuple[str, List[str]]:
     """
-    Filters manifests to only include those older than the specified threshold.
+    Reads the configuration of a single deployment slot.
 
     Args:
-        repositories: Dictionary of repositories and their manifests
-        threshold_days: Age threshold in days
+        web_client: Azure Web Management Client
+        resource_group: Resource group containing the App Service
+        app_name: App Service name
+        slot_name: Deployment slot name
+        acr_login_server: ACR login server (e.g., myacr.azurecr.io)
 
     Returns:
-        Filtered dictionary containing only old manifests
+        Tuple of (image reference or empty string, list of output lines)
     """
-    print("=" * 80)
-    print(f"FILTERING MANIFESTS OLDER THAN {threshold_days} DAYS")
-    print("=" * 80)
+    output = []
 
-    cutoff_date = datetime.now(timezone.utc) - timedelta(days=threshold_days)
-    print(f"Cutoff date: {cutoff_date.strftime('%Y-%m-%d %H:%M:%S UTC')}")
-    print()
+    try:
+        slot_config = web_client.web_apps.get_configuration_slot(
+            resource_group, app_name, slot_name
+        )
 
-    filtered_repositories = {}
-    total_old_manifests = 0
+        # Get app settings for the slot
+        slot_app_settings = web_client.web_apps.list_application_settings_slot(
+            resource_group, app_name, slot_name
+        )
 
-    for repo, manifests in repositories.items():
-        old_manifests = []
+        slot_image = extract_acr_image_from_config(slot_config, acr_login_server, slot_app_settings,
+                                                   log=output.append)
 
-        for manifest in manifests:
-            created_time = manifest.get('created_time')
+        if slot_image:
+            output.append(f"    ✓ Slot '{slot_name}' uses: {slot_image}")
+        else:
+            output.append(f"    - Slot '{slot_name}' has no ACR image")
 
-            if created_time is None:
-                print(f"  Warning: Manifest {manifest['digest'][:12]} has no creation time, skipping")
-                continue
+        return slot_image, output
 
-            if created_time < cutoff_date:
-                old_manifests.append(manifest)
+    except Exception as e:
+        output.append(f"    Warning: Could not read slot '{slot_name}': {e}")
+        return '', output
 
-        if old_manifests:
-            filtered_repositories[repo] = old_manifests
-            total_old_manifests += len(old_manifests)
-            print(f"Repository '{repo}': {len(old_manifests)} old manifests")
 
-    print()
-    print(f"✓ Found {total_old_manifests} manifests older than {threshold_days} days")
-    print()
+def _inspect_app(web_client: WebSiteManagementClient,
+                 app_service,
+                 acr_login_server: str) -> Tuple[str, str, str, List[str], List[str]]:
+    """
+    Reads the production configuration of an App Service and lists its deployment slots.
+    Runs inside a worker thread, so output is buffered and returned to the caller.
 
-    return filtered_repositories
+    Args:
+        web_client: Azure Web Management Client
+        app_service: App Service (site) object from the listing
+        acr_login_server: ACR login server (e.g., myacr.azurecr.io)
+
+    Returns:
+        Tuple of (resource group, app name, production image or empty string,
+        list of slot names, list of output lines)
+    """
+    # Prefer the resource group reported by the service, falling back to the ARM ID
+    resource_group = getattr(app_service, 'resource_group', None) or RESOURCE_GROUP_RE.search(app_service.id).group(1)
+    app_name = app_service.name
 
+    output = [f"Checking App Service: {app_name}"]
+    image = ''
+    slot_names = []
+
+    # Get configuration for the main (production) slot
+    try:
+        config = web_client.web_apps.get_configuration(resource_group, app_name)
+
+        # Also get app settings which may contain DOCKER_CUSTOM_IMAGE_NAME
+        app_settings = web_client.web_apps.list_application_settings(resource_group, app_name)
+
+        image = extract_acr_image_from_config(config, acr_login_server, app_settings, log=output.append)
+
+        if image:
+            output.append(f"  ✓ Production slot uses: {image}")
+        else:
+            output.append(f"  - No ACR image found in production slot")
+
+        # List deployment slots; they are inspected as separate tasks by the caller
+        slots = list(web_client.web_apps.list_slots(resource_group, app_name))
+
+        if slots:
+            output.append(f"  Checking {len(slots)} deployment slots...")
+            slot_names = [slot.name.rsplit('/', 1)[-1] for slot in slots]  # Extract slot name from full name
+
+    except Exception as e:
+        output.append(f"  Warning: Could not read configuration: {e}")
+
+    return resource_group, app_name, image, slot_names, output
 
-# ============================================================================
-# APP SERVICE IMAGE DETECTION
-# ============================================================================
 
 def get_images_in_use_by_app_services(web_client: WebSiteManagementClient,
                                        subscription_id: str,
@@ -333,6 +1055,10 @@ def get_images_in_use_by_app_services(web_client: WebSiteManagementClient,
     Scans all App Services (including deployment slots) in the subscription
     to identify which ACR images are currently in use.
 
+    App Services and deployment slots are inspected as independent tasks on a
+    single executor (bounded by MAX_APP_SERVICE_WORKERS), so slot reads of one
+    App Service overlap with other App Services without spawning nested pools.
+
     Args:
         web_client: Azure Web Management Client
         subscription_id: Azure subscription ID
@@ -343,9 +1069,9 @@ def get_images_in_use_by_app_services(web_client: WebSiteManagementClient,
         Image references format: repository@digest or repository:tag
         App service names format: "app-name" for production, "app-name/slot-name" for slots
     """
-    print("=" * 80)
-    print("SCANNING APP SERVICES FOR IN-USE IMAGES")
-    print("=" * 80)
+    logger.info(_HR)
+    logger.info("SCANNING APP SERVICES FOR IN-USE IMAGES")
+    logger.info(_HR)
 
     images_in_use = set()
     image_to_apps = defaultdict(list)  # Maps image reference to list of app services
@@ -353,82 +1079,68 @@ def get_images_in_use_by_app_services(web_client: WebSiteManagementClient,
 
     try:
         # Get all App Services in the subscription
-        print(f"Fetching all App Services in subscription {subscription_id[:8]}...")
+        logger.info(f"Fetching all App Services in subscription {subscription_id[:8]}...")
         app_services = list(web_client.web_apps.list())
-        print(f"✓ Found {len(app_services)} App Services")
-        print()
-
-        # Check each App Service
-        for app_service in app_services:
-            resource_group = app_service.id.split('/')[4]  # Extract resource group from ARM ID
-            app_name = app_service.name
-
-            print(f"Checking App Service: {app_name}")
-
-            # Get configuration for the main (production) slot
-            try:
-                config = web_client.web_apps.get_configuration(resource_group, app_name)
-
-                # Also get app settings which may contain DOCKER_CUSTOM_IMAGE_NAME
-                app_settings = web_client.web_apps.list_application_settings(resource_group, app_name)
-
-                image = extract_acr_image_from_config(config, acr_login_server, app_settings)
-
-                if image:
-                    images_in_use.add(image)
-                    image_to_apps[image].append(app_name)
-                    print(f"  ✓ Production slot uses: {image}")
-                else:
-                    print(f"  - No ACR image found in production slot")
-
-                # Check all deployment slots
-                slots = list(web_client.web_apps.list_slots(resource_group, app_name))
-
-                if slots:
-                    print(f"  Checking {len(slots)} deployment slots...")
+        logger.info(f"✓ Found {len(app_services)} App Services")
+        logger.info('')
+
+        if app_services:
+            with ThreadPoolExecutor(max_workers=min(MAX_APP_SERVICE_WORKERS, len(app_services))) as executor:
+                # Maps each pending future to (app name, slot name); slot name is None for App Service tasks
+                pending = {
+                    executor.submit(_inspect_app, web_client, app_service, acr_login_server): (app_service.name, None)
+                    for app_service in app_services
+                }
+                app_results = {}  # Maps app name to (output lines, slot names, slot output by slot name)
 
-                    for slot in slots:
-                        slot_name = slot.name.split('/')[-1]  # Extract slot name from full name
+                try:
+                    while pending:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
 
-                        try:
-                            slot_config = web_client.web_apps.get_configuration_slot(
-                                resource_group, app_name, slot_name
-                            )
+                        for future in done:
+                            app_name, slot_name = pending.pop(future)
 
-                            # Get app settings for the slot
-                            slot_app_settings = web_client.web_apps.list_application_settings_slot(
-                                resource_group, app_name, slot_name
-                            )
+                            if slot_name is None:
+                                resource_group, app_name, image, slot_names, output = future.result()
+                                app_results[app_name] = (output, slot_names, {})
 
-                            slot_image = extract_acr_image_from_config(slot_config, acr_login_server, slot_app_settings)
+                                if image:
+                                    images_in_use.add(image)
+                                    image_to_apps[image].append(app_name)
 
-                            if slot_image:
-                                images_in_use.add(slot_image)
-                                slot_full_name = f"{app_name}/{slot_name}"
-                                image_to_apps[slot_image].append(slot_full_name)
-                                print(f"    ✓ Slot '{slot_name}' uses: {slot_image}")
+                                for name in slot_names:
+                                    slot_future = executor.submit(_inspect_slot, web_client, resource_group,
+                                                                  app_name, name, acr_login_server)
+                                    pending[slot_future] = (app_name, name)
                             else:
-                                print(f"    - Slot '{slot_name}' has no ACR image")
-
-                        except Exception as e:
-                            print(f"    Warning: Could not read slot '{slot_name}': {e}")
-
-            except Exception as e:
-                print(f"  Warning: Could not read configuration: {e}")
-
-            print()
-
-        print(f"✓ Total unique ACR images in use: {len(images_in_use)}")
-        print()
+                                slot_image, slot_output = future.result()
+                                app_results[app_name][2][slot_name] = slot_output
+
+                                if slot_image:
+                                    images_in_use.add(slot_image)
+                                    image_to_apps[slot_image].append(f"{app_name}/{slot_name}")
+
+                            # Log each App Service as one record once it and all of its slots are done
+                            output, slot_names, slot_outputs = app_results[app_name]
+                            if len(slot_outputs) == len(slot_names):
+                                lines = output + [line for name in slot_names for line in slot_outputs[name]]
+                                logger.info('\n'.join(lines) + '\n')
+                except (KeyboardInterrupt, Exception):
+                    # Ctrl+C or a failed App Service stops the scan without waiting for queued apps and slots
+                    _cancel_pending(pending)
+                    raise
+
+        logger.info(f"✓ Total unique ACR images in use: {len(images_in_use)}")
+        logger.info('')
 
         return images_in_use, dict(image_to_apps)
 
     except AzureError as e:
-        print(f"\nERROR: Failed to scan App Services: {e}")
+        logger.error(f"\nERROR: Failed to scan App Services: {e}")
         sys.exit(1)
 
 
-def extract_acr_image_from_config(config, acr_login_server: str, app_settings=None) -> str:
+def extract_acr_image_from_config(config, acr_login_server: str, app_settings=None, log=None) -> str:
     """
     Extracts ACR image reference from App Service configuration.
     Handles both Linux and Windows container configurations.
@@ -437,138 +1149,184 @@ def extract_acr_image_from_config(config, acr_login_server: str, app_settings=No
         config: App Service configuration object
         acr_login_server: ACR login server (e.g., myacr.azurecr.io)
         app_settings: App Service application settings (optional)
+        log: Callable receiving output lines (defaults to logger.debug, with
+            warnings going to logger.warning)
 
     Returns:
-        Image reference string or empty string if not found
+        Image reference with a lowercased registry host, or empty string if not found
     """
-    image = None
+    match = None
+    image_setting = None  # Container image value found in the configuration, if any
+    acr_login_server = acr_login_server.lower()
+
+    # Debug lines are only formatted when DEBUG logging is enabled
+    debug = logger.isEnabledFor(logging.DEBUG)
+    warn = log or logger.warning
+    log = log or logger.debug
 
     # Debug: Print what we're checking
-    print(f"    DEBUG: Checking config for {acr_login_server}")
+    if debug:
+        log(f"    DEBUG: Checking config for {acr_login_server}")
 
     # Check for Linux containers
     if hasattr(config, 'linux_fx_version') and config.linux_fx_version:
-        print(f"    DEBUG: linux_fx_version = {config.linux_fx_version}")
+        if debug:
+            log(f"    DEBUG: linux_fx_version = {config.linux_fx_version}")
         # Format is typically "DOCKER|registry.azurecr.io/repo:tag"
-        if config.linux_fx_version.startswith('DOCKER|'):
-            image = config.linux_fx_version.split('|', 1)[1]
+        if config.linux_fx_version.upper().startswith('DOCKER|'):
+            image_setting = config.linux_fx_version
+        match = IMAGE_REF_RE.match(config.linux_fx_version)
 
     # Check for Windows containers
     elif hasattr(config, 'windows_fx_version') and config.windows_fx_version:
-        print(f"    DEBUG: windows_fx_version = {config.windows_fx_version}")
-        if config.windows_fx_version.startswith('DOCKER|'):
-            image = config.windows_fx_version.split('|', 1)[1]
+        if debug:
+            log(f"    DEBUG: windows_fx_version = {config.windows_fx_version}")
+        if config.windows_fx_version.upper().startswith('DOCKER|'):
+            image_setting = config.windows_fx_version
+        match = IMAGE_REF_RE.match(config.windows_fx_version)
 
     # Check app settings for DOCKER_CUSTOM_IMAGE_NAME
-    if not image and app_settings and hasattr(app_settings, 'properties'):
+    if not match and app_settings and hasattr(app_settings, 'properties'):
         settings_dict = app_settings.properties
-        print(f"    DEBUG: Checking app settings, found {len(settings_dict)} settings")
+        if debug:
+            log(f"    DEBUG: Checking app settings, found {len(settings_dict)} settings")
 
         # Check for DOCKER_CUSTOM_IMAGE_NAME
         if 'DOCKER_CUSTOM_IMAGE_NAME' in settings_dict:
-            image = settings_dict['DOCKER_CUSTOM_IMAGE_NAME']
-            print(f"    DEBUG: Found DOCKER_CUSTOM_IMAGE_NAME = {image}")
+            image_setting = image_setting or settings_dict['DOCKER_CUSTOM_IMAGE_NAME']
+            match = IMAGE_REF_RE.match(settings_dict['DOCKER_CUSTOM_IMAGE_NAME'])
+            if debug:
+                log(f"    DEBUG: Found DOCKER_CUSTOM_IMAGE_NAME = {settings_dict['DOCKER_CUSTOM_IMAGE_NAME']}")
 
         # Also check for WEBSITES_CONTAINER_START_TIME_LIMIT and DOCKER_REGISTRY_SERVER_URL
         # which indicate this is a container app
         if 'DOCKER_REGISTRY_SERVER_URL' in settings_dict:
             registry_url = settings_dict['DOCKER_REGISTRY_SERVER_URL']
-            print(f"    DEBUG: Found DOCKER_REGISTRY_SERVER_URL = {registry_url}")
+            if debug:
+                log(f"    DEBUG: Found DOCKER_REGISTRY_SERVER_URL = {registry_url}")
+
+    if not match:
+        if image_setting:
+            # A container app whose image can't be read is not protected from deletion
+            warn(f"  Warning: Could not parse container image setting '{image_setting}'; "
+                 f"its image will not be protected from deletion")
+        elif debug:
+            log(f"    DEBUG: No linux_fx_version, windows_fx_version, or DOCKER_CUSTOM_IMAGE_NAME found")
+        return ''
+
+    # Filter to only include images from our ACR (case-insensitive comparison).
+    # The host is lowercased so references differing only in host casing are the
+    # same image; repository path and tag keep their case. ACR only serves HTTPS,
+    # so an explicit ':443' names the same registry.
+    host = match.group('host').lower()
+    if host.endswith(':443'):
+        host = host[:-len(':443')]
+    if host == acr_login_server:
+        # Interned, as the same image is typically referenced by many apps and slots
+        return sys.intern(host + match.string[match.end('host'):])
+
+    if debug:
+        log(f"    DEBUG: Found image '{match.string}' but it doesn't match ACR server '{acr_login_server}'")
 
-    if not image:
-        print(f"    DEBUG: No linux_fx_version, windows_fx_version, or DOCKER_CUSTOM_IMAGE_NAME found")
+    return ''
 
-    # Filter to only include images from our ACR (case-insensitive comparison)
-    if image and acr_login_server.lower() in image.lower():
-        return image
-    elif image:
-        print(f"    DEBUG: Found image '{image}' but it doesn't match ACR server '{acr_login_server}'")
 
-    return ''
+def _resolve_image(registry: AcrRegistryClient, image_ref: str) -> Tuple[str, List[str]]:
+    """
+    Resolves a single image reference to its manifest digest.
+    Runs inside a worker thread, so output is buffered and returned to the caller.
+
+    Args:
+        registry: ACR registry client
+        image_ref: Image reference from an App Service
+
+    Returns:
+        Tuple of (lowercase manifest digest or empty string, list of output lines)
+    """
+    output = [f"Resolving: {image_ref}"]
+
+    match = IMAGE_REF_RE.match(image_ref)
+    if not match:
+        output.append(f"  Warning: Could not parse image reference")
+        return '', output
 
+    repository, tag, digest = match.group('repository', 'tag', 'digest')
 
-def resolve_images_to_manifests(images_in_use: Set[str], image_to_apps: Dict[str, List[str]], acr_name: str) -> Tuple[Set[str], Dict[str, List[str]]]:
+    # Check if already a digest reference (repository@sha256:...)
+    if digest:
+        digest = digest.lower()  # Normalize to lowercase
+        output.append(f"  ✓ Already a digest: {digest[:12]}...")
+        return digest, output
+
+    # Otherwise it's a tag reference, need to resolve to digest
+    tag = tag or 'latest'
+
+    try:
+        digest = registry.resolve_digest(repository, tag)
+
+        if digest:
+            output.append(f"  ✓ Resolved to digest: {digest[:12]}...")
+        else:
+            output.append(f"  Warning: Could not resolve to digest")
+
+        return digest, output
+
+    except requests.RequestException as e:
+        output.append(f"  Warning: Failed to resolve tag '{repository}:{tag}': {e}")
+        return '', output
+
+
+def resolve_images_to_manifests(images_in_use: Set[str],
+                                image_to_apps: Dict[str, List[str]],
+                                registry: AcrRegistryClient) -> Tuple[Set[str], Dict[str, List[str]]]:
     """
     Converts image references (which may use tags) to manifest digests.
     This ensures we're comparing at the manifest level, not tag level.
     Also maintains the mapping of which app services use which digests.
+    References are resolved concurrently (bounded by MAX_ACR_WORKERS).
 
     Args:
         images_in_use: Set of image references from App Services
         image_to_apps: Dict mapping image references to app service names
-        acr_name: Name of the ACR
+        registry: ACR registry client
 
     Returns:
         Tuple of (Set of manifest digests, Dict mapping digests to app service names)
     """
-    print("=" * 80)
-    print("RESOLVING IMAGE REFERENCES TO MANIFEST DIGESTS")
-    print("=" * 80)
+    logger.info(_HR)
+    logger.info("RESOLVING IMAGE REFERENCES TO MANIFEST DIGESTS")
+    logger.info(_HR)
 
     manifest_digests = set()
     digest_to_apps = defaultdict(list)  # Maps digest to list of app services
-    acr_login_server = f"{acr_name}.azurecr.io"
-
-    for image_ref in images_in_use:
-        print(f"Resolving: {image_ref}")
-
-        # Remove the ACR server prefix to get repository:tag or repository@digest (case-insensitive)
-        if image_ref.lower().startswith(acr_login_server.lower() + '/'):
-            # Find the position after the server name and '/' to extract the image part
-            prefix_length = len(acr_login_server) + 1
-            image_part = image_ref[prefix_length:]
-        else:
-            image_part = image_ref
-
-        # Check if already a digest reference (repository@sha256:...)
-        if '@sha256:' in image_part:
-            digest = image_part.split('@')[1].lower()  # Normalize to lowercase
-            manifest_digests.add(digest)
-            # Map digest to app services
-            if image_ref in image_to_apps:
-                digest_to_apps[digest].extend(image_to_apps[image_ref])
-            print(f"  ✓ Already a digest: {digest[:12]}...")
-            continue
-
-        # Otherwise it's a tag reference, need to resolve to digest
-        if ':' in image_part:
-            repository, tag = image_part.rsplit(':', 1)
-        else:
-            repository = image_part
-            tag = 'latest'
-
-        try:
-            # Use Azure CLI to get manifest for this tag
-            result = subprocess.run(
-                ['az.cmd', 'acr', 'repository', 'show',
-                 '--name', acr_name,
-                 '--image', f"{repository}:{tag}"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
 
-            manifest_info = json.loads(result.stdout)
-            digest = manifest_info.get('digest', '')
-
-            if digest:
-                digest = digest.lower()  # Normalize to lowercase
-                manifest_digests.add(digest)
-                # Map digest to app services
-                if image_ref in image_to_apps:
-                    digest_to_apps[digest].extend(image_to_apps[image_ref])
-                print(f"  ✓ Resolved to digest: {digest[:12]}...")
-            else:
-                print(f"  Warning: Could not resolve to digest")
-
-        except subprocess.CalledProcessError as e:
-            print(f"  Warning: Failed to resolve tag '{repository}:{tag}': {e.stderr}")
-        except json.JSONDecodeError:
-            print(f"  Warning: Failed to parse response for '{repository}:{tag}'")
+    if images_in_use:
+        with ThreadPoolExecutor(max_workers=min(MAX_ACR_WORKERS, len(images_in_use))) as executor:
+            futures = {
+                executor.submit(_resolve_image, registry, image_ref): image_ref
+                for image_ref in images_in_use
+            }
 
-    print()
-    print(f"✓ Resolved {len(manifest_digests)} unique manifest digests in use")
-    print()
+            try:
+                for future in as_completed(futures):
+                    image_ref = futures[future]
+                    digest, output = future.result()
+
+                    logger.info('\n'.join(output))
+
+                    if digest:
+                        digest = sys.intern(digest)
+                        manifest_digests.add(digest)
+                        # Map digest to app services
+                        digest_to_apps[digest].extend(image_to_apps.get(image_ref, ()))
+            except (KeyboardInterrupt, Exception):
+                # Ctrl+C or an unexpected error stops resolution without waiting for queued images
+                _cancel_pending(futures)
+                raise
+
+    logger.info('')
+    logger.info(f"✓ Resolved {len(manifest_digests)} unique manifest digests in use")
+    logger.info('')
 
     return manifest_digests, dict(digest_to_apps)
 
@@ -592,38 +1350,39 @@ def identify_unused_manifests(old_repositories: Dict[str, List[Dict]],
     Returns:
         Tuple of (List of unused manifests, List of old manifests in use with app info)
     """
-    print("=" * 80)
-    print("IDENTIFYING UNUSED MANIFESTS")
-    print("=" * 80)
+    logger.info(_HR)
+    logger.info("IDENTIFYING UNUSED MANIFESTS")
+    logger.info(_HR)
 
     unused_manifests = []
     old_manifests_in_use = []
 
+    # Digests are normalized to lowercase once, when discovered and when resolved,
+    # so matching is a single hash lookup per manifest
     for repo, manifests in old_repositories.items():
-        print(f"Analyzing repository: {repo}")
+        logger.info(f"Analyzing repository: {repo}")
 
         for manifest in manifests:
             digest = manifest['digest']
+            tags_str = manifest['tags_str']
 
             if digest not in manifests_in_use:
                 unused_manifests.append(manifest)
-                tags_str = ', '.join(manifest['tags'])
-                print(f"  ✗ UNUSED: {digest[:12]}... (tags: {tags_str})")
+                logger.info(f"  ✗ UNUSED: {digest[:12]}... (tags: {tags_str})")
             else:
                 # This old manifest is in use - track it for warnings
                 manifest_with_apps = manifest.copy()
                 manifest_with_apps['used_by_apps'] = digest_to_apps.get(digest, [])
                 old_manifests_in_use.append(manifest_with_apps)
 
-                tags_str = ', '.join(manifest['tags'])
-                print(f"  ✓ IN USE: {digest[:12]}... (tags: {tags_str})")
+                logger.info(f"  ✓ IN USE: {digest[:12]}... (tags: {tags_str})")
 
-        print()
+        logger.info('')
 
-    print(f"✓ Found {len(unused_manifests)} unused manifests eligible for deletion")
+    logger.info(f"✓ Found {len(unused_manifests)} unused manifests eligible for deletion")
     if old_manifests_in_use:
-        print(f"⚠ Found {len(old_manifests_in_use)} old manifests still in use by App Services")
-    print()
+        logger.info(f"⚠ Found {len(old_manifests_in_use)} old manifests still in use by App Services")
+    logger.info('')
 
     return unused_manifests, old_manifests_in_use
 
@@ -644,79 +1403,76 @@ def display_old_manifests_warning(old_manifests_in_use: List[Dict], threshold_da
     if not old_manifests_in_use:
         return
 
-    print("=" * 80)
+    print(_HR)
     print("⚠ WARNING: OLD MANIFESTS STILL IN USE BY APP SERVICES")
-    print("=" * 80)
+    print(_HR)
     print()
     print(f"The following {len(old_manifests_in_use)} manifest(s) are older than {threshold_days} days")
     print("but are still being used by App Services and will NOT be deleted.")
     print()
     print("RECOMMENDATION: Consider updating these App Services to use newer images.")
-    print("=" * 80)
+    print(_HR)
     print()
 
-    # Group by repository for cleaner display
-    by_repo = defaultdict(list)
-    for manifest in old_manifests_in_use:
-        by_repo[manifest['repository']].append(manifest)
-
+    # Group by repository and accumulate summary metrics in a single pass
+    now = datetime.now(timezone.utc)
+    by_repo = defaultdict(list)  # Maps repository to list of (manifest, age in days)
     total_size_bytes = 0
+    sum_age_days = 0
     max_age_days = 0
+    affected_apps = set()
+
+    for manifest in old_manifests_in_use:
+        age_days = (now - manifest['created_time']).days
+        by_repo[manifest['repository']].append((manifest, age_days))
+
+        total_size_bytes += manifest['size_bytes']
+        sum_age_days += age_days
+        max_age_days = max(max_age_days, age_days)
+        affected_apps.update(manifest.get('used_by_apps', []))
 
     for repo in sorted(by_repo.keys()):
-        print(f"Repository: {repo}")
-        print("-" * 80)
+        lines = [f"Repository: {repo}", _HR_LIGHT]
 
         # Sort manifests from oldest to newest
-        sorted_manifests = sorted(by_repo[repo], key=lambda m: m['created_time'])
+        sorted_manifests = sorted(by_repo[repo], key=lambda item: item[0]['created_time'])
 
-        for manifest in sorted_manifests:
-            digest = manifest['digest']
-            tags = ', '.join(manifest['tags'])
-            created_time = manifest['created_time']
-            size_mb = manifest['size_bytes'] / (1024 * 1024)
-            total_size_bytes += manifest['size_bytes']
+        for manifest, age_days in sorted_manifests:
             used_by_apps = manifest.get('used_by_apps', [])
 
-            age_days = (datetime.now(timezone.utc) - created_time).days
-            max_age_days = max(max_age_days, age_days)
-            days_over_threshold = age_days - threshold_days
-
-            print(f"  Digest:   {digest}")
-            print(f"  Tags:     {tags}")
-            print(f"  Created:  {created_time.strftime('%Y-%m-%d %H:%M:%S UTC')}")
-            print(f"  Age:      {age_days} days old (⚠ {days_over_threshold} days over threshold)")
-            print(f"  Size:     {size_mb:.2f} MB")
-            print(f"  Used by:  {len(used_by_apps)} App Service(s)")
-
-            for app in sorted(used_by_apps):
-                print(f"            - {app}")
-
-            print()
+            lines.append(f"  Digest:   {manifest['digest']}")
+            lines.append(f"  Tags:     {manifest['tags_str']}")
+            lines.append(f"  Created:  {manifest['created_time'].strftime('%Y-%m-%d %H:%M:%S UTC')}")
+            lines.append(f"  Age:      {age_days} days old (⚠ {age_days - threshold_days} days over threshold)")
+            lines.append(f"  Size:     {manifest['size_bytes'] * _BYTES_TO_MB:.2f} MB")
+            lines.append(f"  Used by:  {len(used_by_apps)} App Service(s)")
+            lines.extend(f"            - {app}" for app in sorted(used_by_apps))
+            lines.append("")
 
-        print()
+        lines.append("")
+        print('\n'.join(lines))
 
-    total_size_mb = total_size_bytes / (1024 * 1024)
-    total_size_gb = total_size_bytes / (1024 * 1024 * 1024)
-    avg_age = sum((datetime.now(timezone.utc) - m['created_time']).days for m in old_manifests_in_use) / len(old_manifests_in_use)
+    total_size_mb = total_size_bytes * _BYTES_TO_MB
+    total_size_gb = total_size_bytes * _BYTES_TO_GB
+    avg_age = sum_age_days / len(old_manifests_in_use)
 
-    print("=" * 80)
+    print(_HR)
     print("OLD MANIFESTS IN USE - SUMMARY METRICS")
-    print("=" * 80)
+    print(_HR)
     print(f"Total old manifests in use:          {len(old_manifests_in_use)}")
     print(f"Total size of old images:            {total_size_gb:.2f} GB ({total_size_mb:.2f} MB)")
     print(f"Oldest manifest age:                 {max_age_days} days")
     print(f"Average age:                         {avg_age:.1f} days")
     print(f"Threshold exceeded by (oldest):      {max_age_days - threshold_days} days")
-    print(f"Total App Services affected:         {len(set(app for m in old_manifests_in_use for app in m.get('used_by_apps', [])))}")
-    print("=" * 80)
+    print(f"Total App Services affected:         {len(affected_apps)}")
+    print(_HR)
     print()
     print("RECOMMENDATIONS:")
     print("  1. Review and update App Services to use newer image versions")
     print("  2. Consider implementing automated image update policies")
     print("  3. Set up monitoring/alerts for image age in production environments")
     print("  4. Review the audit log for detailed information on affected services")
-    print("=" * 80)
+    print(_HR)
     print()
 
 
@@ -731,54 +1487,54 @@ def display_unused_manifests_summary(unused_manifests: List[Dict]):
     Args:
         unused_manifests: List of unused manifest dictionaries
     """
-    print("=" * 80)
+    print(_HR)
     print("UNUSED MANIFESTS SUMMARY")
-    print("=" * 80)
+    print(_HR)
     print()
 
     if not unused_manifests:
         print("No unused manifests found. Nothing to delete!")
         return
 
-    # Group by repository for cleaner display
-    by_repo = defaultdict(list)
-    for manifest in unused_manifests:
-        by_repo[manifest['repository']].append(manifest)
+    lines = []
+    total_size_bytes = sum(map(itemgetter('size_bytes'), unused_manifests))
+    now = datetime.now(timezone.utc)
 
-    total_size_bytes = 0
+    # Group by repository for cleaner display, with manifests from oldest to newest
+    sorted_manifests = sorted(unused_manifests, key=itemgetter('repository', 'created_time'))
 
-    for repo in sorted(by_repo.keys()):
-        print(f"Repository: {repo}")
-        print("-" * 80)
-
-        # Sort manifests from oldest to newest
-        sorted_manifests = sorted(by_repo[repo], key=lambda m: m['created_time'])
+    for repo, manifests in groupby(sorted_manifests, key=itemgetter('repository')):
+        lines.append(f"Repository: {repo}")
+        lines.append(_HR_LIGHT)
 
-        for manifest in sorted_manifests:
+        for manifest in manifests:
             digest = manifest['digest']
-            tags = ', '.join(manifest['tags'])
+            tags = manifest['tags_str']
             created_time = manifest['created_time']
-            size_mb = manifest['size_bytes'] / (1024 * 1024)
-            total_size_bytes += manifest['size_bytes']
+            size_mb = manifest['size_bytes'] * _BYTES_TO_MB
 
-            age_days = (datetime.now(timezone.utc) - created_time).days
+            age_days = (now - created_time).days
 
-            print(f"  Digest:  {digest}")
-            print(f"  Tags:    {tags}")
-            print(f"  Created: {created_time.strftime('%Y-%m-%d %H:%M:%S UTC')} ({age_days} days ago)")
-            print(f"  Size:    {size_mb:.2f} MB")
-            print()
+            lines.append(f"  Digest:  {digest}")
+            lines.append(f"  Tags:    {tags}")
+            lines.append(f"  Created: {created_time.strftime('%Y-%m-%d %H:%M:%S UTC')} ({age_days} days ago)")
+            lines.append(f"  Size:    {size_mb:.2f} MB")
+            lines.append('')
 
-        print()
+        lines.append('')
 
-    total_size_mb = total_size_bytes / (1024 * 1024)
-    total_size_gb = total_size_bytes / (1024 * 1024 * 1024)
+    total_size_mb = total_size_bytes * _BYTES_TO_MB
+    total_size_gb = total_size_bytes * _BYTES_TO_GB
 
-    print("=" * 80)
-    print(f"Total manifests to delete: {len(unused_manifests)}")
-    print(f"Total space to reclaim: {total_size_gb:.2f} GB ({total_size_mb:.2f} MB)")
-    print("=" * 80)
-    print()
+    lines.append(_HR)
+    lines.append(f"Total manifests to delete: {len(unused_manifests)}")
+    lines.append(f"Total space to reclaim: {total_size_gb:.2f} GB ({total_size_mb:.2f} MB)")
+    lines.append(_HR)
+    lines.append('')
+
+    # Emit the report with a single write; per-line prints are slow when stdout is redirected
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
 
 
 def mock_delete_manifests(unused_manifests: List[Dict], acr_name: str):
@@ -790,50 +1546,117 @@ def mock_delete_manifests(unused_manifests: List[Dict], acr_name: str):
         unused_manifests: List of unused manifest dictionaries
         acr_name: Name of the ACR
     """
-    print("=" * 80)
+    print(_HR)
     print("MOCK DELETION (NO ACTUAL DELETION OCCURS)")
-    print("=" * 80)
+    print(_HR)
     print()
 
     if not unused_manifests:
         print("No manifests to delete.")
         return
 
-    print("The following Azure CLI commands would be executed:")
-    print()
+    lines = [
+        "The following Azure CLI commands would be executed:",
+        ''
+    ]
+
+    total = len(unused_manifests)
+    # The equivalent Azure CLI command for each deletion, up to the image reference
+    command_prefix = f"az acr repository delete --name {acr_name} --image"
 
     for i, manifest in enumerate(unused_manifests, 1):
         repo = manifest['repository']
         digest = manifest['digest']
-        tags = ', '.join(manifest['tags'])
+        tags = manifest['tags_str']
 
-        # The actual command that would be run in production mode
-        command = f"az acr repository delete --name {acr_name} --image {repo}@{digest} --yes"
+        lines.extend([
+            f"[{i}/{total}] {command_prefix} {repo}@{digest} --yes",
+            f"         (Would delete: {repo}@{digest[:12]}... with tags: {tags})",
+            ''
+        ])
+
+    lines.append(_HR)
+    lines.append("MOCK DELETION COMPLETE - No images were actually deleted")
+    lines.append(_HR)
+
+    # Emit the report with a single write; per-line prints are slow when stdout is redirected
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
 
-        print(f"[{i}/{len(unused_manifests)}] {command}")
-        print(f"         (Would delete: {repo}@{digest[:12]}... with tags: {tags})")
-        print()
 
-    print("=" * 80)
-    print("MOCK DELETION COMPLETE - No images were actually deleted")
-    print("=" * 80)
+def _delete_manifest(manifest: Dict, registry: AcrRegistryClient) -> Tuple[Optional[Dict], Dict, List[str]]:
+    """
+    Deletes a single manifest from ACR.
+    Runs inside a worker thread, so output is buffered and returned to the caller.
 
+    Args:
+        manifest: Manifest dictionary
+        registry: ACR registry client
 
-def hard_delete_manifests(unused_manifests: List[Dict], acr_name: str) -> Optional[Dict]:
+    Returns:
+        Tuple of (failure details or None on success, deletion result for the audit log,
+        list of output lines)
+    """
+    repo = manifest['repository']
+    digest = manifest['digest']
+    tags = manifest['tags_str']
+
+    try:
+        # Execute the actual deletion request
+        registry.delete_manifest(repo, digest)
+
+        result = {
+            'status': 'success',
+            'repository': repo,
+            'tags': tags,
+            'timestamp': datetime.now(timezone.utc)
+        }
+        return None, result, [f"  ✓ Successfully deleted {repo}@{digest[:12]}..."]
+
+    except requests.Timeout:
+        error_msg = f'Deletion request timed out after {ACR_HTTP_TIMEOUT} seconds'
+        output = [f"  ✗ TIMEOUT deleting {repo}@{digest[:12]}..."]
+
+    except requests.RequestException as e:
+        error_msg = str(e)
+        output = [
+            f"  ✗ FAILED to delete {repo}@{digest[:12]}...",
+            f"     Error: {error_msg}"
+        ]
+
+    failure = {
+        'repository': repo,
+        'digest': digest,
+        'tags': tags,
+        'error': error_msg
+    }
+    result = {
+        'status': 'failed',
+        'repository': repo,
+        'tags': tags,
+        'error': error_msg,
+        'timestamp': datetime.now(timezone.utc)
+    }
+    return failure, result, output
+
+
+def hard_delete_manifests(unused_manifests: List[Dict], registry: AcrRegistryClient) -> Optional[Dict]:
     """
     Performs actual deletion of unused manifests from ACR.
     WARNING: This permanently deletes container images!
 
     Args:
         unused_manifests: List of unused manifest dictionaries
-        acr_name: Name of the ACR
+        registry: ACR registry client
 
     Returns:
-        Dictionary mapping digest to deletion result, or None if cancelled
+        Dictionary mapping (repository, digest) to deletion result, or None if cancelled.
+        If the deletions are interrupted (Ctrl+C or an unexpected error), the
+        results of the deletions that did complete are returned.
     """
-    print("=" * 80)
+    print(_HR)
     print("HARD DELETION MODE - IMAGES WILL BE PERMANENTLY DELETED!")
-    print("=" * 80)
+    print(_HR)
     print()
 
     if not unused_manifests:
@@ -852,89 +1675,89 @@ def hard_delete_manifests(unused_manifests: List[Dict], acr_name: str) -> Option
         return None
 
     print()
-    print("=" * 80)
+    print(_HR)
     print("BEGINNING DELETION PROCESS")
-    print("=" * 80)
+    print(_HR)
     print()
 
     deleted_count = 0
-    failed_count = 0
     failed_deletions = []
-    deletion_results = {}  # Track results for audit
-
-    for i, manifest in enumerate(unused_manifests, 1):
-        repo = manifest['repository']
-        digest = manifest['digest']
-        tags = ', '.join(manifest['tags'])
-
-        print(f"[{i}/{len(unused_manifests)}] Deleting {repo}@{digest[:12]}... (tags: {tags})")
-
-        try:
-            # Execute the actual deletion command
-            result = subprocess.run(
-                ['az.cmd', 'acr', 'repository', 'delete',
-                 '--name', acr_name,
-                 '--image', f"{repo}@{digest}",
-                 '--yes'],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=60  # 60 second timeout per deletion
-            )
-
-            print(f"  ✓ Successfully deleted {repo}@{digest[:12]}...")
+    # Track results for audit, keyed by (repository, digest) as the same
+    # manifest digest can exist in more than one repository
+    deletion_results = {}
+    total = len(unused_manifests)
+
+    pending = []  # Progress lines not yet written
+    completed = set()  # Futures whose results have been recorded
+    interruption = None  # Ctrl+C or unexpected error that stopped the deletions
+
+    def record(future):
+        """Records a finished deletion and writes progress in batches."""
+        nonlocal deleted_count
+        manifest = futures[future]
+        failure, result, output = future.result()
+        deletion_results[(manifest['repository'], manifest['digest'])] = result
+        completed.add(future)
+
+        if failure:
+            failed_deletions.append(failure)
+        else:
             deleted_count += 1
-            deletion_results[digest] = {
-                'status': 'success',
-                'repository': repo,
-                'tags': tags,
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            }
 
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.strip() if e.stderr else str(e)
-            print(f"  ✗ FAILED to delete {repo}@{digest[:12]}...")
-            print(f"     Error: {error_msg}")
-            failed_count += 1
-            failed_deletions.append({
-                'repository': repo,
-                'digest': digest,
-                'tags': tags,
-                'error': error_msg
-            })
-            deletion_results[digest] = {
-                'status': 'failed',
-                'repository': repo,
-                'tags': tags,
-                'error': error_msg,
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            }
+        i = len(completed)
+        pending.append(f"[{i}/{total}] {manifest['repository']}@{manifest['digest'][:12]}... "
+                       f"(tags: {result['tags']})")
+        pending.extend(output)
+        pending.append('')
+
+        # Write progress in batches, and right away after a failure so it is visible
+        if failure or i % DELETE_PROGRESS_BATCH_SIZE == 0 or i == total:
+            sys.stdout.write('\n'.join(pending) + '\n')
+            sys.stdout.flush()
+            pending.clear()
+
+    # Deletions are independent, so they run concurrently; progress is printed
+    # from this thread as they complete so lines never interleave
+    with ThreadPoolExecutor(max_workers=min(MAX_DELETE_WORKERS, total)) as executor:
+        futures = {
+            executor.submit(_delete_manifest, manifest, registry): manifest
+            for manifest in unused_manifests
+        }
 
-        except subprocess.TimeoutExpired:
-            error_msg = 'Deletion command timed out after 60 seconds'
-            print(f"  ✗ TIMEOUT deleting {repo}@{digest[:12]}...")
-            failed_count += 1
-            failed_deletions.append({
-                'repository': repo,
-                'digest': digest,
-                'tags': tags,
-                'error': error_msg
-            })
-            deletion_results[digest] = {
-                'status': 'failed',
-                'repository': repo,
-                'tags': tags,
-                'error': error_msg,
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            }
+        try:
+            for future in as_completed(futures):
+                record(future)
+        except (KeyboardInterrupt, Exception) as e:
+            # Stop queued deletions; leaving the executor only waits for those in flight
+            interruption = e
+            for future in futures:
+                future.cancel()
+
+    if interruption is not None:
+        # Record deletions that were already running, so the audit log reflects them
+        for future in futures:
+            if future not in completed and not future.cancelled() and future.exception() is None:
+                record(future)
+
+        if pending:
+            sys.stdout.write('\n'.join(pending) + '\n')
+            sys.stdout.flush()
+
+        print(_HR)
+        if isinstance(interruption, KeyboardInterrupt):
+            print("DELETION INTERRUPTED BY USER - remaining manifests were not deleted")
+        else:
+            print(f"DELETION STOPPED BY UNEXPECTED ERROR: {interruption}")
 
-        print()
+    failed_count = len(failed_deletions)
 
     # Summary
-    print("=" * 80)
-    print("DELETION COMPLETE")
-    print("=" * 80)
+    print(_HR)
+    print("DELETION COMPLETE" if interruption is None else "DELETION SUMMARY (INCOMPLETE)")
+    print(_HR)
     print(f"Successfully deleted: {deleted_count}/{len(unused_manifests)} manifests")
+    if interruption is not None:
+        print(f"Not completed: {len(unused_manifests) - len(completed)}/{len(unused_manifests)} manifests")
 
     if failed_count > 0:
         print(f"Failed deletions: {failed_count}/{len(unused_manifests)} manifests")
@@ -946,7 +1769,7 @@ def hard_delete_manifests(unused_manifests: List[Dict], acr_name: str) -> Option
             print(f"    Error: {failure['error']}")
             print()
 
-    print("=" * 80)
+    print(_HR)
 
     return deletion_results
 
@@ -959,9 +1782,9 @@ def select_deletion_mode() -> str:
         'mock' or 'hard' based on user selection
     """
     print()
-    print("=" * 80)
+    print(_HR)
     print("DELETION MODE SELECTION")
-    print("=" * 80)
+    print(_HR)
     print()
     print("Please select a deletion mode:")
     print()
@@ -1017,11 +1840,10 @@ def get_system_info() -> Dict:
         result = subprocess.run(
             ['az.cmd', '--version'],
             capture_output=True,
-            text=True,
             timeout=10
         )
-        # Extract just the first line which contains the version
-        az_version = result.stdout.split('\n')[0] if result.stdout else 'Unknown'
+        # Decode just the first line, which contains the version
+        az_version = result.stdout.split(b'\n', 1)[0].decode('utf-8', 'replace') if result.stdout else 'Unknown'
         system_info['azure_cli_version'] = az_version.strip()
     except Exception:
         system_info['azure_cli_version'] = 'Unable to determine'
@@ -1029,6 +1851,152 @@ def get_system_info() -> Dict:
     return system_info
 
 
+def _json_default(value):
+    """
+    Serializes values the standard library JSON encoder does not handle natively.
+
+    Args:
+        value: Value to serialize
+
+    Returns:
+        JSON-serializable representation (ISO 8601 string for datetimes)
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _encode_json(value, pretty: bool) -> bytes:
+    """
+    Encodes a value as UTF-8 JSON, using orjson when installed.
+    Datetimes are written in ISO 8601 format by both encoders.
+
+    Args:
+        value: Value to encode
+        pretty: Indent with two spaces instead of writing compact output
+
+    Returns:
+        Encoded JSON
+    """
+    if orjson_dumps is not None:
+        return orjson_dumps(value, option=OPT_INDENT_2 if pretty else 0)
+
+    return json.dumps(
+        value,
+        indent=2 if pretty else None,
+        separators=(',', ': ') if pretty else (',', ':'),
+        ensure_ascii=False,
+        default=_json_default
+    ).encode('utf-8')
+
+
+def _write_audit_json(f, sections: List[Tuple[str, object]], pretty: bool = False):
+    """
+    Writes the audit document as a JSON object to a binary file.
+    Sections that are not dictionaries (lists or generators of records) are streamed
+    one record at a time, so the manifest lists are never serialized as a whole.
+    Pretty output matches json.dump(dict(sections), f, indent=2).
+
+    Args:
+        f: File opened in binary mode
+        sections: Top-level (key, value) pairs, in output order
+        pretty: Indent with two spaces instead of writing compact output
+    """
+    newline = b'\n' if pretty else b''
+    pad = b'  ' if pretty else b''
+    key_separator = b': ' if pretty else b':'
+
+    def encode(value, depth: int) -> bytes:
+        data = _encode_json(value, pretty)
+        if pretty:
+            # Shift nested lines to the value's position in the document
+            data = data.replace(b'\n', b'\n' + pad * depth)
+        return data
+
+    f.write(b'{')
+    for i, (key, value) in enumerate(sections):
+        f.write((b',' if i else b'') + newline + pad + _encode_json(key, False) + key_separator)
+
+        if isinstance(value, dict):
+            f.write(encode(value, 1))
+            continue
+
+        f.write(b'[')
+        empty = True
+        for item in value:
+            f.write((b'' if empty else b',') + newline + pad * 2)
+            f.write(encode(item, 2))
+            empty = False
+        if not empty:
+            f.write(newline + pad)
+        f.write(b']')
+    f.write(newline + b'}')
+
+
+def _build_manifest_record(manifest: Dict, now: datetime, deletion_result: Optional[Dict] = None) -> Dict:
+    """
+    Builds the audit record for a manifest identified for deletion.
+
+    Args:
+        manifest: Manifest dictionary
+        now: Reference time for the manifest age
+        deletion_result: Result of deleting this manifest (hard delete only)
+
+    Returns:
+        Audit record dictionary
+    """
+    created_time = manifest['created_time']
+    size_bytes = manifest['size_bytes']
+    manifest_data = {
+        'repository': manifest['repository'],
+        'digest': manifest['digest'],
+        'tags': manifest['tags'],
+        'created_time': created_time,
+        'age_days': (now - created_time).days if created_time else None,
+        'size_bytes': size_bytes,
+        'size_mb': round(size_bytes * _BYTES_TO_MB, 2),
+    }
+
+    # Add deletion result if this was a hard delete
+    if deletion_result is not None:
+        manifest_data['deletion_result'] = deletion_result
+
+    return manifest_data
+
+
+def _build_old_manifest_record(manifest: Dict, now: datetime, threshold_days: int) -> Dict:
+    """
+    Builds the audit record for an old manifest that is protected because it is still in use.
+
+    Args:
+        manifest: Manifest dictionary with app service info
+        now: Reference time for the manifest age
+        threshold_days: Age threshold in days
+
+    Returns:
+        Audit record dictionary
+    """
+    created_time = manifest['created_time']
+    size_bytes = manifest['size_bytes']
+    used_by_apps = manifest.get('used_by_apps', [])
+    age_days = (now - created_time).days if created_time else None
+
+    return {
+        'repository': manifest['repository'],
+        'digest': manifest['digest'],
+        'tags': manifest['tags'],
+        'created_time': created_time,
+        'age_days': age_days,
+        'days_over_threshold': (age_days - threshold_days) if created_time else None,
+        'size_bytes': size_bytes,
+        'size_mb': round(size_bytes * _BYTES_TO_MB, 2),
+        'used_by_app_services': used_by_apps,
+        'app_service_count': len(used_by_apps),
+        'status': 'protected_from_deletion',
+        'warning': f'This manifest is {age_days} days old, exceeding the {threshold_days}-day threshold'
+    }
+
+
 def write_audit_log(
     deletion_mode: str,
     subscription_id: str,
@@ -1041,7 +2009,8 @@ def write_audit_log(
     deletion_results: Optional[Dict] = None,
     images_in_use_count: int = 0,
     total_manifests_scanned: int = 0,
-    old_manifests_count: int = 0
+    old_manifests_count: int = 0,
+    system_info: Optional[Dict] = None
 ) -> str:
     """
     Writes comprehensive audit log to JSON file.
@@ -1055,10 +2024,11 @@ def write_audit_log(
         end_time: Script end time
         unused_manifests: List of unused manifest dictionaries
         old_manifests_in_use: List of old manifests still in use with app service info
-        deletion_results: Results from hard delete (if applicable)
+        deletion_results: Results from hard delete, keyed by (repository, digest) (if applicable)
         images_in_use_count: Number of images found in use
         total_manifests_scanned: Total number of manifests scanned
         old_manifests_count: Number of manifests older than threshold
+        system_info: Pre-gathered system information (gathered here if not provided)
 
     Returns:
         Path to the audit file created
@@ -1075,116 +2045,90 @@ def write_audit_log(
     filename = f"{timestamp}_{deletion_mode}_{acr_name}_{manifest_count}_manifests.json"
     filepath = AUDIT_DIR / filename
 
-    # Build audit data structure
-    audit_data = {
-        'audit_metadata': {
+    # Single reference time for all age calculations
+    now = datetime.now(timezone.utc)
+
+    # Header sections; the manifest lists below are streamed into the file after them
+    sections = [
+        ('audit_metadata', {
             'audit_file_version': '1.0',
             'script_version': SCRIPT_VERSION,
-            'generated_at': datetime.now(timezone.utc).isoformat(),
-        },
-        'execution_info': {
+            'generated_at': now,
+        }),
+        ('execution_info', {
             'deletion_mode': deletion_mode,
-            'start_time': start_time.isoformat(),
-            'end_time': end_time.isoformat(),
+            'start_time': start_time,
+            'end_time': end_time,
             'duration_seconds': round(duration_seconds, 2),
             'duration_human': f"{int(duration_seconds // 60)}m {int(duration_seconds % 60)}s",
             'executed_by': getpass.getuser(),
-        },
-        'configuration': {
+        }),
+        ('configuration', {
             'subscription_id': subscription_id,
             'acr_name': acr_name,
             'acr_resource_group': acr_resource_group,
             'image_age_threshold_days': IMAGE_AGE_THRESHOLD_DAYS,
-        },
-        'system_info': get_system_info(),
-        'summary': {
+        }),
+        ('system_info', system_info if system_info is not None else get_system_info()),
+        ('summary', {
             'total_manifests_scanned': total_manifests_scanned,
             'manifests_older_than_threshold': old_manifests_count,
             'images_in_use': images_in_use_count,
             'unused_manifests_identified': manifest_count,
             'old_manifests_still_in_use': len(old_manifests_in_use),
             'old_manifests_still_in_use_warning': 'These manifests are older than threshold but protected from deletion' if old_manifests_in_use else None,
-        },
-        'manifests': [],
-        'old_manifests_in_use': []
-    }
-
-    # Sort manifests by creation time (oldest to newest) regardless of repository
-    sorted_manifests = sorted(
-        unused_manifests,
-        key=lambda m: m['created_time'] if m['created_time'] else datetime.min.replace(tzinfo=timezone.utc)
-    )
-
-    # Add detailed manifest information
-    for manifest in sorted_manifests:
-        manifest_data = {
-            'repository': manifest['repository'],
-            'digest': manifest['digest'],
-            'tags': manifest['tags'],
-            'created_time': manifest['created_time'].isoformat() if manifest['created_time'] else None,
-            'age_days': (datetime.now(timezone.utc) - manifest['created_time']).days if manifest['created_time'] else None,
-            'size_bytes': manifest['size_bytes'],
-            'size_mb': round(manifest['size_bytes'] / (1024 * 1024), 2),
-        }
-
-        # Add deletion result if this was a hard delete
-        if deletion_results and manifest['digest'] in deletion_results:
-            manifest_data['deletion_result'] = deletion_results[manifest['digest']]
-
-        audit_data['manifests'].append(manifest_data)
-
-    # Add old manifests in use information
-    if old_manifests_in_use:
-        # Sort by age (oldest first)
-        sorted_old_manifests = sorted(
-            old_manifests_in_use,
-            key=lambda m: m['created_time'] if m['created_time'] else datetime.min.replace(tzinfo=timezone.utc)
+        }),
+    ]
+
+    # Sort manifests by creation time (oldest to newest) regardless of repository.
+    # Every manifest has a creation time, as discovery skips manifests without one.
+    sorted_manifests = sorted(unused_manifests, key=itemgetter('created_time'))
+
+    # Old manifests in use, sorted by age (oldest first)
+    sorted_old_manifests = sorted(old_manifests_in_use, key=itemgetter('created_time'))
+
+    # Records are built one at a time as the file is written; deletion results
+    # are only looked up after a hard delete
+    if deletion_results:
+        manifest_records = (
+            _build_manifest_record(manifest, now, deletion_results.get((manifest['repository'], manifest['digest'])))
+            for manifest in sorted_manifests
         )
+    else:
+        manifest_records = (_build_manifest_record(manifest, now) for manifest in sorted_manifests)
 
-        for manifest in sorted_old_manifests:
-            old_manifest_data = {
-                'repository': manifest['repository'],
-                'digest': manifest['digest'],
-                'tags': manifest['tags'],
-                'created_time': manifest['created_time'].isoformat() if manifest['created_time'] else None,
-                'age_days': (datetime.now(timezone.utc) - manifest['created_time']).days if manifest['created_time'] else None,
-                'days_over_threshold': ((datetime.now(timezone.utc) - manifest['created_time']).days - IMAGE_AGE_THRESHOLD_DAYS) if manifest['created_time'] else None,
-                'size_bytes': manifest['size_bytes'],
-                'size_mb': round(manifest['size_bytes'] / (1024 * 1024), 2),
-                'used_by_app_services': manifest.get('used_by_apps', []),
-                'app_service_count': len(manifest.get('used_by_apps', [])),
-                'status': 'protected_from_deletion',
-                'warning': f'This manifest is {(datetime.now(timezone.utc) - manifest["created_time"]).days} days old, exceeding the {IMAGE_AGE_THRESHOLD_DAYS}-day threshold'
-            }
-
-            audit_data['old_manifests_in_use'].append(old_manifest_data)
+    sections.append(('manifests', manifest_records))
+    sections.append(('old_manifests_in_use', (
+        _build_old_manifest_record(manifest, now, IMAGE_AGE_THRESHOLD_DAYS) for manifest in sorted_old_manifests
+    )))
 
     # Add deletion summary for hard delete mode
     if deletion_mode == 'hard' and deletion_results:
         successful = sum(1 for r in deletion_results.values() if r['status'] == 'success')
         failed = sum(1 for r in deletion_results.values() if r['status'] == 'failed')
 
-        audit_data['deletion_summary'] = {
+        sections.append(('deletion_summary', {
             'total_attempted': len(deletion_results),
             'successful': successful,
             'failed': failed,
             'success_rate': round((successful / len(deletion_results) * 100), 2) if deletion_results else 0,
-        }
+        }))
 
         # Add failed deletions details
         if failed > 0:
-            audit_data['failed_deletions'] = [
+            sections.append(('failed_deletions', (
                 {
+                    'repository': repository,
                     'digest': digest,
                     'error': result['error']
                 }
-                for digest, result in deletion_results.items()
+                for (repository, digest), result in deletion_results.items()
                 if result['status'] == 'failed'
-            ]
+            )))
 
-    # Write to file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(audit_data, f, indent=2, ensure_ascii=False)
+    # Write to file through a large buffer, streaming the manifest lists
+    with open(filepath, 'wb', buffering=1 << 20) as f:
+        _write_audit_json(f, sections, pretty=AUDIT_PRETTY)
 
     return str(filepath)
 
@@ -1200,10 +2144,18 @@ def main():
     # Track execution start time
     start_time = datetime.now(timezone.utc)
 
+    configure_logging()
+
+    # Gather system information for the audit log in the background, as probing
+    # the Azure CLI version can take seconds and is only needed at the end
+    system_info_executor = ThreadPoolExecutor(max_workers=1)
+    system_info_future = system_info_executor.submit(get_system_info)
+    system_info_executor.shutdown(wait=False)
+
     print()
-    print("╔" + "=" * 78 + "╗")
+    print(_BOX_TOP)
     print("║" + " " * 15 + "AZURE CONTAINER REGISTRY CLEANUP TOOL" + " " * 26 + "║")
-    print("╚" + "=" * 78 + "╝")
+    print(_BOX_BOT)
     print()
 
     # Step 1: Validate configuration and get runtime values
@@ -1211,20 +2163,18 @@ def main():
 
     # Step 2: Authenticate with Azure
     credential, acr_client, web_client = authenticate_azure(subscription_id)
+    registry = AcrRegistryClient(acr_name, credential)
 
-    # Step 3: Discover all ACR manifests
-    all_repositories = get_all_acr_manifests(acr_name, acr_resource_group)
-
-    # Calculate total manifests scanned
-    total_manifests_scanned = sum(len(manifests) for manifests in all_repositories.values())
-
-    # Step 4: Filter manifests by age
-    old_repositories = filter_manifests_by_age(all_repositories, IMAGE_AGE_THRESHOLD_DAYS)
+    # Steps 3-4: Discover ACR manifests, keeping only those older than the threshold
+    old_repositories, total_manifests_scanned = get_all_acr_manifests(
+        registry, IMAGE_AGE_THRESHOLD_DAYS, ACR_REPOSITORIES
+    )
 
     # Calculate old manifests count
     old_manifests_count = sum(len(manifests) for manifests in old_repositories.values())
 
     if not old_repositories:
+        flush_logs()
         print("No manifests found older than the threshold. Exiting.")
         return
 
@@ -1232,12 +2182,13 @@ def main():
     images_in_use, image_to_apps = get_images_in_use_by_app_services(web_client, subscription_id, acr_name)
 
     # Step 6: Resolve image references to manifest digests
-    manifests_in_use, digest_to_apps = resolve_images_to_manifests(images_in_use, image_to_apps, acr_name)
+    manifests_in_use, digest_to_apps = resolve_images_to_manifests(images_in_use, image_to_apps, registry)
 
     # Step 7: Identify unused manifests and old manifests still in use
     unused_manifests, old_manifests_in_use = identify_unused_manifests(old_repositories, manifests_in_use, digest_to_apps)
 
     # Step 8: Display summary
+    flush_logs()
     display_unused_manifests_summary(unused_manifests)
 
     # Step 9: Display warnings for old manifests still in use
@@ -1254,7 +2205,7 @@ def main():
             if deletion_mode == 'mock':
                 mock_delete_manifests(unused_manifests, acr_name)
             elif deletion_mode == 'hard':
-                deletion_results = hard_delete_manifests(unused_manifests, acr_name)
+                deletion_results = hard_delete_manifests(unused_manifests, registry)
 
         except KeyboardInterrupt:
             print("\n\nOperation cancelled by user.")
@@ -1278,22 +2229,23 @@ def main():
                 deletion_results=deletion_results,
                 images_in_use_count=len(images_in_use),
                 total_manifests_scanned=total_manifests_scanned,
-                old_manifests_count=old_manifests_count
+                old_manifests_count=old_manifests_count,
+                system_info=system_info_future.result()
             )
             print()
-            print("=" * 80)
+            print(_HR)
             print(f"✓ Audit log written to: {audit_file}")
-            print("=" * 80)
+            print(_HR)
         except Exception as e:
             print()
-            print("=" * 80)
+            print(_HR)
             print(f"⚠ Warning: Failed to write audit log: {e}")
-            print("=" * 80)
+            print(_HR)
 
     print()
-    print("=" * 80)
+    print(_HR)
     print("SCRIPT EXECUTION COMPLETE")
-    print("=" * 80)
+    print(_HR)
     print()
 
 
@@ -1301,9 +2253,11 @@ if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
+        flush_logs()
         print("\n\nScript interrupted by user.")
         sys.exit(0)
     except Exception as e:
+        flush_logs()
         print(f"\n\nFATAL ERROR: {e}")
         import traceback
         traceback.print_exc()